@@ -2,17 +2,237 @@
 Программа для управления клиентами с использованием базы данных PostgreSQL
 """
 
+import csv
+import io
+from contextlib import contextmanager
+
 import psycopg2
+import psycopg2.extras
 from psycopg2 import Error
-from typing import List, Optional, Dict, Any
+from psycopg2.errors import ForeignKeyViolation
+from psycopg2.pool import ThreadedConnectionPool
+from typing import List, Optional, Dict, Any, Iterator
+
+# ========== КОНСТАНТЫ ==========
+# Все неизменяемые строки собраны здесь, чтобы не собирать их заново
+# при каждом вызове методов
+
+BANNER = "=" * 60
+
+# Структура базы данных
+SQL_CREATE_CLIENTS = """
+    CREATE TABLE IF NOT EXISTS clients (
+        client_id SERIAL PRIMARY KEY,
+        first_name VARCHAR(50) NOT NULL,
+        last_name VARCHAR(50) NOT NULL,
+        email VARCHAR(100) UNIQUE NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+# Телефон без номера не имеет смысла, поэтому phone_number NOT NULL:
+# уникальный индекс не хранит NULL-записи и быстрее проверяется в ON CONFLICT
+SQL_CREATE_PHONES = """
+    CREATE TABLE IF NOT EXISTS phones (
+        phone_id SERIAL PRIMARY KEY,
+        client_id INTEGER NOT NULL REFERENCES clients(client_id) ON DELETE CASCADE,
+        phone_number VARCHAR(20) NOT NULL UNIQUE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+# Индекс по внешнему ключу: без него CASCADE и выборка телефонов
+# клиента просматривают всю таблицу phones
+SQL_CREATE_PHONES_CLIENT_INDEX = """
+    CREATE INDEX IF NOT EXISTS ix_phones_client_id ON phones (client_id);
+"""
+
+# Индексы для поиска по подстроке (ILIKE '%...%'). Требуют расширения
+# pg_trgm, которое может быть не установлено или недоступно пользователю
+SQL_CREATE_TRGM_INDEXES = """
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    CREATE INDEX IF NOT EXISTS ix_clients_fn_trgm ON clients USING gin (first_name gin_trgm_ops);
+    CREATE INDEX IF NOT EXISTS ix_clients_ln_trgm ON clients USING gin (last_name gin_trgm_ops);
+    CREATE INDEX IF NOT EXISTS ix_clients_email_trgm ON clients USING gin (email gin_trgm_ops);
+    CREATE INDEX IF NOT EXISTS ix_phones_number_trgm ON phones USING gin (phone_number gin_trgm_ops);
+"""
+
+# Серверные prepared statements: разбираются PostgreSQL один раз при
+# подключении, а затем вызываются через EXECUTE без повторного планирования
+PREPARED_STATEMENTS = {
+    'ins_client': """
+        PREPARE ins_client(text, text, text) AS
+        INSERT INTO clients (first_name, last_name, email)
+        VALUES ($1, $2, $3)
+        RETURNING client_id
+    """,
+    # Клиент и его телефоны одним запросом (один обмен с сервером)
+    'ins_client_phones': """
+        PREPARE ins_client_phones(text, text, text, text[]) AS
+        WITH new_client AS (
+            INSERT INTO clients (first_name, last_name, email)
+            VALUES ($1, $2, $3)
+            RETURNING client_id
+        ), new_phones AS (
+            INSERT INTO phones (client_id, phone_number)
+            SELECT client_id, unnest($4) FROM new_client
+            ON CONFLICT (phone_number) DO NOTHING
+            RETURNING phone_id
+        )
+        SELECT client_id, (SELECT count(*) FROM new_phones) AS phones_added FROM new_client
+    """,
+    'ins_phone': """
+        PREPARE ins_phone(integer, text) AS
+        INSERT INTO phones (client_id, phone_number)
+        VALUES ($1, $2)
+        ON CONFLICT (phone_number) DO NOTHING
+        RETURNING phone_id
+    """,
+    'del_phone': """
+        PREPARE del_phone(integer, text) AS
+        DELETE FROM phones
+        WHERE client_id = $1 AND phone_number = $2
+        RETURNING phone_id
+    """,
+    'del_client': """
+        PREPARE del_client(integer) AS
+        DELETE FROM clients WHERE client_id = $1
+        RETURNING first_name, last_name
+    """,
+    'client_exists': """
+        PREPARE client_exists(integer) AS
+        SELECT EXISTS (SELECT 1 FROM clients WHERE client_id = $1) AS client_exists
+    """,
+    # NULL в параметре означает "оставить поле без изменений"
+    'upd_client': """
+        PREPARE upd_client(text, text, text, integer) AS
+        UPDATE clients SET
+            first_name = COALESCE($1, first_name),
+            last_name = COALESCE($2, last_name),
+            email = COALESCE($3, email)
+        WHERE client_id = $4
+    """,
+}
+
+SQL_INS_CLIENT = "EXECUTE ins_client(%s, %s, %s)"
+SQL_INS_CLIENT_PHONES = "EXECUTE ins_client_phones(%s, %s, %s, %s)"
+SQL_INS_PHONE = "EXECUTE ins_phone(%s, %s)"
+SQL_DEL_PHONE = "EXECUTE del_phone(%s, %s)"
+SQL_DEL_CLIENT = "EXECUTE del_client(%s)"
+SQL_CLIENT_EXISTS = "EXECUTE client_exists(%s)"
+SQL_UPD_CLIENT = "EXECUTE upd_client(%s, %s, %s, %s)"
+
+# Пакетная вставка через execute_values: строк в одном INSERT-запросе
+# и порог, начиная с которого телефоны загружаются через COPY
+PAGE_SIZE = 1000
+COPY_THRESHOLD = 10000
+
+SQL_INS_CLIENTS_VALUES = """
+    INSERT INTO clients (first_name, last_name, email)
+    VALUES %s
+    RETURNING client_id, email;
+"""
+
+SQL_INS_PHONES_VALUES = """
+    INSERT INTO phones (client_id, phone_number)
+    VALUES %s
+    ON CONFLICT (phone_number) DO NOTHING
+    RETURNING phone_id;
+"""
+
+# Массовая загрузка через COPY. Временные таблицы видны только своей
+# сессии и удаляются при завершении транзакции загрузки
+SQL_CREATE_CLIENTS_STAGE = """
+    CREATE TEMP TABLE clients_stage (
+        first_name VARCHAR(50),
+        last_name VARCHAR(50),
+        email VARCHAR(100)
+    ) ON COMMIT DROP;
+"""
+
+SQL_COPY_CLIENTS_STAGE = "COPY clients_stage (first_name, last_name, email) FROM STDIN WITH CSV"
+
+SQL_MERGE_CLIENTS_STAGE = """
+    INSERT INTO clients (first_name, last_name, email)
+    SELECT first_name, last_name, email FROM clients_stage
+    ON CONFLICT (email) DO NOTHING
+    RETURNING client_id;
+"""
+
+SQL_CREATE_PHONES_STAGE = """
+    CREATE TEMP TABLE phones_stage (
+        client_id INTEGER,
+        phone_number VARCHAR(20)
+    ) ON COMMIT DROP;
+"""
+
+SQL_COPY_PHONES_STAGE = "COPY phones_stage (client_id, phone_number) FROM STDIN WITH CSV"
+
+SQL_MERGE_PHONES_STAGE = """
+    INSERT INTO phones (client_id, phone_number)
+    SELECT s.client_id, s.phone_number
+    FROM phones_stage s
+    JOIN clients c ON c.client_id = s.client_id
+    ON CONFLICT (phone_number) DO NOTHING;
+"""
+
+# Выборка клиентов: телефоны собираются подзапросом (без JOIN и GROUP BY)
+# в JSON-массив, который psycopg2 разбирает одним вызовом json.loads
+SQL_SELECT_CLIENTS = """
+    SELECT
+        c.client_id,
+        c.first_name,
+        c.last_name,
+        c.email,
+        c.created_at,
+        (
+            SELECT COALESCE(JSON_AGG(p.phone_number) FILTER (WHERE p.phone_number IS NOT NULL), '[]'::json)
+            FROM phones p
+            WHERE p.client_id = c.client_id
+        ) as phones
+    FROM clients c
+"""
+
+SQL_FIND_CLIENT = SQL_SELECT_CLIENTS + "WHERE {} ORDER BY c.client_id;"
+SQL_CLIENT_INFO = SQL_SELECT_CLIENTS + "WHERE c.client_id = %s;"
+SQL_ALL_CLIENTS = SQL_SELECT_CLIENTS + "ORDER BY c.client_id;"
+
+SQL_PHONE_CONDITION = "c.client_id IN (SELECT client_id FROM phones WHERE phone_number ILIKE %s)"
+
+# Условия поиска по полям клиента
+SEARCH_CONDITIONS = {
+    'first_name': "c.first_name ILIKE %s",
+    'last_name': "c.last_name ILIKE %s",
+    'email': "c.email ILIKE %s",
+    'phone': SQL_PHONE_CONDITION,
+}
+
+
+class ClientConnection(psycopg2.extensions.connection):
+    """Подключение, которое помнит имена подготовленных на нем запросов"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
 
 
 class ClientDatabase:
     """Класс для работы с базой данных клиентов"""
 
-    def __init__(self, dbname: str, user: str, password: str, host: str = "localhost", port: str = "5432"):
+    def __init__(self, dbname: str, user: str, password: str, host: str = "localhost", port: str = "5432",
+                 verbose: bool = False, minconn: int = 4, maxconn: int = 32):
         """
-        Инициализация подключения к базе данных
+        Инициализация пула подключений к базе данных
+
+        Методы класса можно вызывать из разных потоков: каждый вызов берет
+        свое подключение из пула. Пул не ждет освобождения подключений:
+        если одновременно выполняется больше maxconn вызовов, лишние
+        завершаются ошибкой "connection pool exhausted".
+
+        Prepared statements создаются на каждом подключении и живут в его
+        серверной сессии, поэтому нужно прямое подключение к PostgreSQL
+        (или pgbouncer в режиме session pooling); в режиме transaction
+        pooling они работать не будут.
 
         Args:
             dbname: название базы данных
@@ -20,20 +240,38 @@ class ClientDatabase:
             password: пароль
             host: хост (по умолчанию localhost)
             port: порт (по умолчанию 5432)
+            verbose: выводить подробные сообщения о каждой операции
+            minconn: сколько подключений открыть сразу
+            maxconn: максимальное число одновременных подключений
+                (открытые подключения остаются в пуле до close_connection)
         """
-        self.connection = None
+        self.pool = None
+        self.verbose = verbose
         try:
-            print(f"Подключаюсь к базе данных {dbname}...")
-            self.connection = psycopg2.connect(
+            if self.verbose:
+                print(f"Подключаюсь к базе данных {dbname}...")
+            # Кодировка задается явно: строки с кириллицей кодируются
+            # в UTF-8 без перекодировок на стороне сервера.
+            # Строки результатов psycopg2 сразу возвращает словарями
+            self.pool = ThreadedConnectionPool(
+                minconn,
+                maxconn,
                 dbname=dbname,
                 user=user,
                 password=password,
                 host=host,
-                port=port
+                port=port,
+                client_encoding='UTF8',
+                cursor_factory=psycopg2.extras.RealDictCursor,
+                connection_factory=ClientConnection
             )
-            self.connection.autocommit = True
-            self.cursor = self.connection.cursor()
-            print("✓ Подключение успешно установлено")
+            # Пул закрывает возвращаемые подключения сверх minconn; после
+            # открытия начальных подключений поднимаем порог до maxconn, чтобы
+            # созданные при нагрузке подключения (и их prepared statements)
+            # оставались в пуле, а не открывались заново при каждом всплеске
+            self.pool.minconn = maxconn
+            if self.verbose:
+                print("✓ Подключение успешно установлено")
         except Error as e:
             print(f"✗ Ошибка при подключении: {e}")
             print("\nСОВЕТ: Убедитесь что:")
@@ -42,6 +280,48 @@ class ClientDatabase:
             print("3. Правильные логин/пароль")
             raise
 
+    @staticmethod
+    def _print_client(number: int, client: Dict[str, Any]) -> None:
+        """Выводит данные одного клиента"""
+        print(f"\n{number}. {client['first_name']} {client['last_name']}")
+        print(f"   ID: {client['client_id']}")
+        print(f"   Email: {client['email']}")
+        print(f"   Телефоны: {', '.join(client['phones']) if client['phones'] else 'нет телефонов'}")
+        print(f"   Зарегистрирован: {client['created_at'].strftime('%d.%m.%Y %H:%M')}")
+
+    @contextmanager
+    def _conn(self):
+        """
+        Берет подключение из пула на время одной транзакции
+
+        Транзакция фиксируется при успешном выходе из блока и
+        откатывается при исключении, после чего подключение
+        возвращается в пул.
+        """
+        connection = self.pool.getconn()
+        try:
+            with connection:
+                yield connection
+        finally:
+            self.pool.putconn(connection)
+
+    def _prepare_statements(self, cursor) -> None:
+        """
+        Подготавливает на сервере часто используемые запросы (PREPARE)
+
+        Prepared statements живут в рамках сессии, поэтому выполняются
+        один раз для каждого подключения пула. Вызывается после создания
+        таблиц, так как PREPARE проверяет их существование.
+        """
+        # PREPARE не отменяется откатом транзакции, поэтому имя запоминается
+        # сразу: если какой-то PREPARE упадет, повторный вызов подготовит
+        # только оставшиеся запросы, без ошибки "already exists"
+        prepared = cursor.connection.prepared_statements
+        for name, statement in PREPARED_STATEMENTS.items():
+            if name not in prepared:
+                cursor.execute(statement)
+                prepared.add(name)
+
     def create_tables(self) -> None:
         """
         Функция 1: Создает структуру БД (таблицы)
@@ -50,45 +330,55 @@ class ClientDatabase:
         - clients: для хранения информации о клиентах
         - phones: для хранения телефонов клиентов (один ко многим)
         """
-        print("\n" + "=" * 60)
-        print("СОЗДАНИЕ СТРУКТУРЫ БАЗЫ ДАННЫХ")
-        print("=" * 60)
+        if self.verbose:
+            print("\n" + BANNER)
+            print("СОЗДАНИЕ СТРУКТУРЫ БАЗЫ ДАННЫХ")
+            print(BANNER)
+
+        try:
+            with self._conn() as connection, connection.cursor() as cursor:
+                # 1. Таблица клиентов
+                if self.verbose:
+                    print("Создаю таблицу 'clients'...")
+                cursor.execute(SQL_CREATE_CLIENTS)
+                if self.verbose:
+                    print("✓ Таблица 'clients' создана")
+
+                # 2. Таблица телефонов
+                if self.verbose:
+                    print("Создаю таблицу 'phones'...")
+                cursor.execute(SQL_CREATE_PHONES)
+                if self.verbose:
+                    print("✓ Таблица 'phones' создана")
+
+                cursor.execute(SQL_CREATE_PHONES_CLIENT_INDEX)
+
+                self._prepare_statements(cursor)
+
+        except Error as e:
+            print(f"✗ Ошибка при создании таблиц: {e}")
+            return
 
+        # 3. Индексы для поиска - отдельной транзакцией: без pg_trgm
+        # поиск работает, просто медленнее, а таблицы уже созданы
         try:
-            # 1. Таблица клиентов
-            print("Создаю таблицу 'clients'...")
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS clients (
-                    client_id SERIAL PRIMARY KEY,
-                    first_name VARCHAR(50) NOT NULL,
-                    last_name VARCHAR(50) NOT NULL,
-                    email VARCHAR(100) UNIQUE NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-            """)
-            print("✓ Таблица 'clients' создана")
-
-            # 2. Таблица телефонов
-            print("Создаю таблицу 'phones'...")
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS phones (
-                    phone_id SERIAL PRIMARY KEY,
-                    client_id INTEGER NOT NULL REFERENCES clients(client_id) ON DELETE CASCADE,
-                    phone_number VARCHAR(20) UNIQUE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-            """)
-            print("✓ Таблица 'phones' создана")
+            with self._conn() as connection, connection.cursor() as cursor:
+                if self.verbose:
+                    print("Создаю индексы для поиска...")
+                cursor.execute(SQL_CREATE_TRGM_INDEXES)
+                if self.verbose:
+                    print("✓ Индексы созданы")
+        except Error as e:
+            print(f"⚠ Индексы для поиска не созданы (нужно расширение pg_trgm): {e}")
 
+        if self.verbose:
             print("\n✅ Структура базы данных успешно создана!")
             print("\nСозданные таблицы:")
             print("1. clients - информация о клиентах")
             print("2. phones - телефоны клиентов (связь один-ко-многим)")
 
-        except Error as e:
-            print(f"✗ Ошибка при создании таблиц: {e}")
-
-    def add_client(self, first_name: str, last_name: str, email: str, phones: Optional[List[str]] = None) -> int:
+    def add_client(self, first_name: str, last_name: str, email: str, phones: Optional[List[str]] = None,
+                   page_size: int = PAGE_SIZE) -> int:
         """
         Функция 2: Добавляет нового клиента
 
@@ -97,41 +387,96 @@ class ClientDatabase:
             last_name: фамилия клиента
             email: email клиента (уникальный)
             phones: список телефонов (опционально)
+            page_size: если телефонов не больше page_size, клиент и телефоны
+                вставляются одним запросом; иначе телефоны добавляются
+                отдельными запросами по page_size штук (или через COPY,
+                если их больше COPY_THRESHOLD)
 
         Returns:
             ID созданного клиента или -1 при ошибке
         """
-        print(f"\n{'=' * 60}")
-        print(f"ДОБАВЛЕНИЕ НОВОГО КЛИЕНТА")
-        print(f"{'=' * 60}")
-        print(f"Имя: {first_name}")
-        print(f"Фамилия: {last_name}")
-        print(f"Email: {email}")
-        if phones:
-            print(f"Телефоны: {', '.join(phones)}")
-
-        try:
-            # Вставляем данные клиента
-            self.cursor.execute("""
-                INSERT INTO clients (first_name, last_name, email) 
-                VALUES (%s, %s, %s) 
-                RETURNING client_id;
-            """, (first_name, last_name, email))
-
-            client_id = self.cursor.fetchone()[0]
-            print(f"✓ Клиент создан с ID: {client_id}")
-
-            # Если переданы телефоны, добавляем их
+        if self.verbose:
+            print(f"\n{BANNER}")
+            print("ДОБАВЛЕНИЕ НОВОГО КЛИЕНТА")
+            print(BANNER)
+            print(f"Имя: {first_name}")
+            print(f"Фамилия: {last_name}")
+            print(f"Email: {email}")
             if phones:
-                for phone in phones:
-                    self.add_phone(client_id, phone)
+                print(f"Телефоны: {', '.join(phones)}")
 
-            return client_id
+        try:
+            with self._conn() as connection, connection.cursor() as cursor:
+                self._prepare_statements(cursor)
+
+                if phones and len(phones) <= page_size:
+                    # Клиент и телефоны вставляются одним запросом
+                    cursor.execute(SQL_INS_CLIENT_PHONES, (first_name, last_name, email, phones))
+                    result = cursor.fetchone()
+                    client_id, added = result['client_id'], result['phones_added']
+                    if self.verbose:
+                        print(f"✓ Клиент создан с ID: {client_id}")
+                        # Повторы внутри списка ON CONFLICT схлопывает в один телефон
+                        unique_phones = len(set(phones))
+                        print(f"✓ Добавлено телефонов: {added} из {unique_phones}")
+                        if added < unique_phones:
+                            print("⚠ Часть телефонов уже существует у других клиентов")
+                    return client_id
+
+                # Вставляем данные клиента
+                cursor.execute(SQL_INS_CLIENT, (first_name, last_name, email))
+
+                client_id = cursor.fetchone()['client_id']
+                if self.verbose:
+                    print(f"✓ Клиент создан с ID: {client_id}")
+
+                # Большие списки телефонов добавляем пакетами
+                if phones:
+                    self._add_phones_bulk(cursor, client_id, phones, page_size)
+
+                return client_id
 
         except Error as e:
             print(f"✗ Ошибка при добавлении клиента: {e}")
             return -1
 
+    def _add_phones_bulk(self, cursor, client_id: int, phones: List[str], page_size: int = PAGE_SIZE) -> int:
+        """
+        Добавляет сразу несколько телефонов клиенту INSERT-запросами по page_size строк
+
+        Существование клиента не проверяется: вызывается из add_client
+        сразу после вставки клиента. Больше COPY_THRESHOLD телефонов
+        загружаются через COPY.
+
+        Args:
+            cursor: курсор текущей транзакции
+            client_id: ID клиента
+            phones: список телефонов
+            page_size: сколько телефонов вставлять одним запросом
+
+        Returns:
+            Количество добавленных телефонов
+        """
+        rows = [(client_id, phone) for phone in phones]
+        if len(rows) > COPY_THRESHOLD:
+            added = self._copy_phones(cursor, rows)
+        else:
+            added = len(psycopg2.extras.execute_values(
+                cursor,
+                SQL_INS_PHONES_VALUES,
+                rows,
+                template="(%s, %s)",
+                page_size=page_size,
+                fetch=True
+            ))
+
+        if self.verbose:
+            unique_phones = len(set(phones))
+            print(f"✓ Добавлено телефонов: {added} из {unique_phones}")
+            if added < unique_phones:
+                print("⚠ Часть телефонов уже существует у других клиентов")
+        return added
+
     def add_phone(self, client_id: int, phone: str) -> bool:
         """
         Функция 3: Добавляет телефон для существующего клиента
@@ -143,31 +488,29 @@ class ClientDatabase:
         Returns:
             True если успешно, False если ошибка
         """
-        print(f"\nДобавляю телефон для клиента ID {client_id}: {phone}")
+        if self.verbose:
+            print(f"\nДобавляю телефон для клиента ID {client_id}: {phone}")
 
         try:
-            # Проверяем существование клиента
-            self.cursor.execute("SELECT client_id FROM clients WHERE client_id = %s", (client_id,))
-            if not self.cursor.fetchone():
-                print(f"✗ Клиент с ID {client_id} не найден")
-                return False
-
-            # Добавляем телефон
-            self.cursor.execute("""
-                INSERT INTO phones (client_id, phone_number)
-                VALUES (%s, %s)
-                ON CONFLICT (phone_number) DO NOTHING
-                RETURNING phone_id;
-            """, (client_id, phone))
-
-            result = self.cursor.fetchone()
-            if result:
-                print(f"✓ Телефон добавлен (ID: {result[0]})")
-                return True
-            else:
-                print("⚠ Этот телефон уже существует у другого клиента")
-                return False
-
+            with self._conn() as connection, connection.cursor() as cursor:
+                self._prepare_statements(cursor)
+
+                # Существование клиента проверяет внешний ключ
+                cursor.execute(SQL_INS_PHONE, (client_id, phone))
+
+                result = cursor.fetchone()
+                if result:
+                    if self.verbose:
+                        print(f"✓ Телефон добавлен (ID: {result['phone_id']})")
+                    return True
+                else:
+                    if self.verbose:
+                        print("⚠ Этот телефон уже существует у другого клиента")
+                    return False
+
+        except ForeignKeyViolation:
+            print(f"✗ Клиент с ID {client_id} не найден")
+            return False
         except Error as e:
             print(f"✗ Ошибка при добавлении телефона: {e}")
             return False
@@ -183,47 +526,37 @@ class ClientDatabase:
         Returns:
             True если успешно, False если ошибка
         """
-        print(f"\n{'=' * 60}")
-        print(f"ОБНОВЛЕНИЕ ДАННЫХ КЛИЕНТА ID: {client_id}")
-        print(f"{'=' * 60}")
-
-        # Показываем что обновляем
-        for key, value in kwargs.items():
-            print(f"{key}: {value}")
-
-        try:
-            # Проверяем существование клиента
-            self.cursor.execute("SELECT client_id FROM clients WHERE client_id = %s", (client_id,))
-            if not self.cursor.fetchone():
-                print(f"✗ Клиент с ID {client_id} не найден")
-                return False
-
-            # Формируем запрос на обновление
-            update_fields = []
-            values = []
+        if self.verbose:
+            print(f"\n{BANNER}")
+            print(f"ОБНОВЛЕНИЕ ДАННЫХ КЛИЕНТА ID: {client_id}")
+            print(BANNER)
 
-            if 'first_name' in kwargs:
-                update_fields.append("first_name = %s")
-                values.append(kwargs['first_name'])
+            # Показываем что обновляем
+            for key, value in kwargs.items():
+                print(f"{key}: {value}")
 
-            if 'last_name' in kwargs:
-                update_fields.append("last_name = %s")
-                values.append(kwargs['last_name'])
-
-            if 'email' in kwargs:
-                update_fields.append("email = %s")
-                values.append(kwargs['email'])
-
-            if not update_fields:
-                print("⚠ Не указаны поля для обновления")
-                return False
-
-            values.append(client_id)
-            query = f"UPDATE clients SET {', '.join(update_fields)} WHERE client_id = %s"
+        if not any(key in kwargs for key in ('first_name', 'last_name', 'email')):
+            print("⚠ Не указаны поля для обновления")
+            return False
 
-            self.cursor.execute(query, values)
-            print(f"✓ Данные клиента обновлены")
-            return True
+        try:
+            with self._conn() as connection, connection.cursor() as cursor:
+                self._prepare_statements(cursor)
+
+                # Необновляемые поля передаются как NULL и остаются прежними
+                cursor.execute(SQL_UPD_CLIENT, (
+                    kwargs.get('first_name'),
+                    kwargs.get('last_name'),
+                    kwargs.get('email'),
+                    client_id
+                ))
+                if not cursor.rowcount:
+                    print(f"✗ Клиент с ID {client_id} не найден")
+                    return False
+
+                if self.verbose:
+                    print("✓ Данные клиента обновлены")
+                return True
 
         except Error as e:
             print(f"✗ Ошибка при обновлении клиента: {e}")
@@ -240,28 +573,29 @@ class ClientDatabase:
         Returns:
             True если успешно, False если ошибка
         """
-        print(f"\nУдаляю телефон {phone} у клиента ID {client_id}")
+        if self.verbose:
+            print(f"\nУдаляю телефон {phone} у клиента ID {client_id}")
 
         try:
-            # Проверяем существование клиента
-            self.cursor.execute("SELECT client_id FROM clients WHERE client_id = %s", (client_id,))
-            if not self.cursor.fetchone():
-                print(f"✗ Клиент с ID {client_id} не найден")
-                return False
-
-            # Удаляем телефон
-            self.cursor.execute("""
-                DELETE FROM phones 
-                WHERE client_id = %s AND phone_number = %s
-                RETURNING phone_id;
-            """, (client_id, phone))
-
-            result = self.cursor.fetchone()
-            if result:
-                print(f"✓ Телефон удален (ID телефона: {result[0]})")
-                return True
-            else:
-                print(f"✗ Телефон {phone} не найден у клиента с ID {client_id}")
+            with self._conn() as connection, connection.cursor() as cursor:
+                self._prepare_statements(cursor)
+
+                # Удаляем телефон
+                cursor.execute(SQL_DEL_PHONE, (client_id, phone))
+
+                result = cursor.fetchone()
+                if result:
+                    if self.verbose:
+                        print(f"✓ Телефон удален (ID телефона: {result['phone_id']})")
+                    return True
+
+                # Клиента проверяем только если удалять было нечего,
+                # чтобы сообщить точную причину
+                cursor.execute(SQL_CLIENT_EXISTS, (client_id,))
+                if cursor.fetchone()['client_exists']:
+                    print(f"✗ Телефон {phone} не найден у клиента с ID {client_id}")
+                else:
+                    print(f"✗ Клиент с ID {client_id} не найден")
                 return False
 
         except Error as e:
@@ -278,29 +612,26 @@ class ClientDatabase:
         Returns:
             True если успешно, False если ошибка
         """
-        print(f"\n{'=' * 60}")
-        print(f"УДАЛЕНИЕ КЛИЕНТА ID: {client_id}")
-        print(f"{'=' * 60}")
+        if self.verbose:
+            print(f"\n{BANNER}")
+            print(f"УДАЛЕНИЕ КЛИЕНТА ID: {client_id}")
+            print(BANNER)
 
         try:
-            # Получаем информацию о клиенте перед удалением
-            self.cursor.execute("""
-                SELECT first_name, last_name FROM clients 
-                WHERE client_id = %s
-            """, (client_id,))
-
-            client_info = self.cursor.fetchone()
-            if not client_info:
-                print(f"✗ Клиент с ID {client_id} не найден")
-                return False
+            with self._conn() as connection, connection.cursor() as cursor:
+                self._prepare_statements(cursor)
 
-            print(f"Удаляю клиента: {client_info[0]} {client_info[1]}")
+                # Удаляем клиента (телефоны удалятся автоматически благодаря CASCADE)
+                cursor.execute(SQL_DEL_CLIENT, (client_id,))
 
-            # Удаляем клиента (телефоны удалятся автоматически благодаря CASCADE)
-            self.cursor.execute("DELETE FROM clients WHERE client_id = %s", (client_id,))
+                client_info = cursor.fetchone()
+                if not client_info:
+                    print(f"✗ Клиент с ID {client_id} не найден")
+                    return False
 
-            print("✓ Клиент и все его телефоны удалены")
-            return True
+                if self.verbose:
+                    print(f"✓ Клиент {client_info['first_name']} {client_info['last_name']} и все его телефоны удалены")
+                return True
 
         except Error as e:
             print(f"✗ Ошибка при удалении клиента: {e}")
@@ -316,84 +647,45 @@ class ClientDatabase:
         Returns:
             Список найденных клиентов
         """
-        print(f"\n{'=' * 60}")
-        print("ПОИСК КЛИЕНТА")
-        print(f"{'=' * 60}")
+        if self.verbose:
+            print(f"\n{BANNER}")
+            print("ПОИСК КЛИЕНТА")
+            print(BANNER)
 
-        # Показываем параметры поиска
-        for key, value in kwargs.items():
-            print(f"Поиск по {key}: {value}")
+            # Показываем параметры поиска
+            for key, value in kwargs.items():
+                print(f"Поиск по {key}: {value}")
 
         try:
-            conditions = []
-            values = []
-
-            # Формируем условия поиска
-            if 'first_name' in kwargs:
-                conditions.append("c.first_name ILIKE %s")
-                values.append(f"%{kwargs['first_name']}%")
-
-            if 'last_name' in kwargs:
-                conditions.append("c.last_name ILIKE %s")
-                values.append(f"%{kwargs['last_name']}%")
-
-            if 'email' in kwargs:
-                conditions.append("c.email ILIKE %s")
-                values.append(f"%{kwargs['email']}%")
-
-            if 'phone' in kwargs:
-                conditions.append("p.phone_number ILIKE %s")
-                values.append(f"%{kwargs['phone']}%")
-
-            if not conditions:
-                print("⚠ Не указаны параметры поиска")
-                return []
-
-            # Строим запрос
-            query = """
-                SELECT DISTINCT 
-                    c.client_id, 
-                    c.first_name, 
-                    c.last_name, 
-                    c.email,
-                    c.created_at,
-                    ARRAY_AGG(p.phone_number) FILTER (WHERE p.phone_number IS NOT NULL) as phones
-                FROM clients c
-                LEFT JOIN phones p ON c.client_id = p.client_id
-                WHERE {}
-                GROUP BY c.client_id, c.first_name, c.last_name, c.email, c.created_at
-                ORDER BY c.client_id;
-            """.format(" AND ".join(conditions))
-
-            self.cursor.execute(query, values)
-            results = self.cursor.fetchall()
-
-            # Форматируем результаты
-            clients = []
-            for row in results:
-                client = {
-                    'client_id': row[0],
-                    'first_name': row[1],
-                    'last_name': row[2],
-                    'email': row[3],
-                    'created_at': row[4],
-                    'phones': row[5] if row[5] else []
-                }
-                clients.append(client)
-
-            # Показываем результаты
-            if clients:
-                print(f"\n✅ Найдено клиентов: {len(clients)}")
-                for i, client in enumerate(clients, 1):
-                    print(f"\n{i}. {client['first_name']} {client['last_name']}")
-                    print(f"   ID: {client['client_id']}")
-                    print(f"   Email: {client['email']}")
-                    print(f"   Телефоны: {', '.join(client['phones']) if client['phones'] else 'нет телефонов'}")
-                    print(f"   Зарегистрирован: {client['created_at'].strftime('%d.%m.%Y %H:%M')}")
-            else:
-                print("\n❌ Клиенты не найдены")
-
-            return clients
+            with self._conn() as connection, connection.cursor() as cursor:
+                conditions = []
+                values = []
+
+                # Формируем условия поиска
+                for key, condition in SEARCH_CONDITIONS.items():
+                    if key in kwargs:
+                        conditions.append(condition)
+                        values.append(f"%{kwargs[key]}%")
+
+                if not conditions:
+                    print("⚠ Не указаны параметры поиска")
+                    return []
+
+                # Строим запрос: сначала отбираем клиентов, затем для каждого
+                # собираем телефоны подзапросом
+                cursor.execute(SQL_FIND_CLIENT.format(" AND ".join(conditions)), values)
+                clients = cursor.fetchall()
+
+                # Показываем результаты
+                if self.verbose:
+                    if clients:
+                        print(f"\n✅ Найдено клиентов: {len(clients)}")
+                        for i, client in enumerate(clients, 1):
+                            self._print_client(i, client)
+                    else:
+                        print("\n❌ Клиенты не найдены")
+
+                return clients
 
         except Error as e:
             print(f"✗ Ошибка при поиске клиента: {e}")
@@ -401,100 +693,201 @@ class ClientDatabase:
 
     # ========== ДОПОЛНИТЕЛЬНЫЕ ФУНКЦИИ ==========
 
+    def add_clients(self, clients: List[tuple]) -> List[int]:
+        """
+        Добавляет сразу нескольких клиентов с телефонами
+
+        Клиенты и телефоны вставляются двумя запросами execute_values
+        в одной транзакции.
+
+        Args:
+            clients: список кортежей (first_name, last_name, email, phones)
+
+        Returns:
+            Список ID клиентов в порядке входного списка (-1 при ошибке)
+        """
+        if self.verbose:
+            print(f"\n{BANNER}")
+            print(f"ДОБАВЛЕНИЕ КЛИЕНТОВ (всего: {len(clients)})")
+            print(BANNER)
+
+        client_rows = [(first_name, last_name, email) for first_name, last_name, email, _ in clients]
+
+        try:
+            with self._conn() as connection, connection.cursor() as cursor:
+                inserted = psycopg2.extras.execute_values(
+                    cursor,
+                    SQL_INS_CLIENTS_VALUES,
+                    client_rows,
+                    template="(%s, %s, %s)",
+                    page_size=PAGE_SIZE,
+                    fetch=True
+                )
+                ids_by_email = {row['email']: row['client_id'] for row in inserted}
+
+                phone_rows = [
+                    (ids_by_email[email], phone)
+                    for _, _, email, phones in clients
+                    for phone in (phones or [])
+                ]
+                if phone_rows:
+                    psycopg2.extras.execute_values(
+                        cursor,
+                        SQL_INS_PHONES_VALUES,
+                        phone_rows,
+                        template="(%s, %s)",
+                        page_size=PAGE_SIZE
+                    )
+        except Error as e:
+            print(f"✗ Ошибка при добавлении клиентов: {e}")
+            return [-1] * len(clients)
+
+        if self.verbose:
+            for first_name, last_name, email, phones in clients:
+                print(f"✓ {first_name} {last_name} ({email}) - ID: {ids_by_email[email]}")
+                if phones:
+                    print(f"   Телефоны: {', '.join(phones)}")
+
+        return [ids_by_email[email] for _, _, email, _ in clients]
+
+    def _copy_rows(self, cursor, copy_sql: str, rows: List[tuple]) -> None:
+        """
+        Передает строки на сервер через COPY FROM STDIN в формате CSV
+
+        Args:
+            cursor: курсор текущей транзакции
+            copy_sql: команда COPY ... FROM STDIN WITH CSV
+            rows: список кортежей со значениями столбцов
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        cursor.copy_expert(copy_sql, buffer)
+
+    def _copy_phones(self, cursor, rows: List[tuple]) -> int:
+        """
+        Загружает телефоны через COPY в рамках текущей транзакции
+
+        Args:
+            cursor: курсор текущей транзакции
+            rows: список кортежей (client_id, phone_number)
+
+        Returns:
+            Количество добавленных телефонов
+        """
+        cursor.execute(SQL_CREATE_PHONES_STAGE)
+        self._copy_rows(cursor, SQL_COPY_PHONES_STAGE, rows)
+        cursor.execute(SQL_MERGE_PHONES_STAGE)
+        return cursor.rowcount
+
+    def bulk_load_clients(self, rows: List[tuple]) -> List[int]:
+        """
+        Массовая загрузка клиентов через COPY
+
+        Строки загружаются во временную таблицу clients_stage, откуда
+        переносятся в clients. Клиенты с уже существующим email пропускаются.
+
+        Args:
+            rows: список кортежей (first_name, last_name, email)
+
+        Returns:
+            Список ID добавленных клиентов
+        """
+        if self.verbose:
+            print(f"\nМассовая загрузка клиентов: {len(rows)}")
+
+        try:
+            with self._conn() as connection, connection.cursor() as cursor:
+                cursor.execute(SQL_CREATE_CLIENTS_STAGE)
+                self._copy_rows(cursor, SQL_COPY_CLIENTS_STAGE, rows)
+
+                cursor.execute(SQL_MERGE_CLIENTS_STAGE)
+                client_ids = [row['client_id'] for row in cursor.fetchall()]
+
+                if self.verbose:
+                    print(f"✓ Добавлено клиентов: {len(client_ids)} из {len(rows)}")
+                return client_ids
+
+        except Error as e:
+            print(f"✗ Ошибка при загрузке клиентов: {e}")
+            return []
+
+    def bulk_load_phones(self, rows: List[tuple]) -> int:
+        """
+        Массовая загрузка телефонов через COPY
+
+        Телефоны несуществующих клиентов и уже занятые номера пропускаются.
+
+        Args:
+            rows: список кортежей (client_id, phone_number)
+
+        Returns:
+            Количество добавленных телефонов
+        """
+        if self.verbose:
+            print(f"\nМассовая загрузка телефонов: {len(rows)}")
+
+        try:
+            with self._conn() as connection, connection.cursor() as cursor:
+                added = self._copy_phones(cursor, rows)
+
+                if self.verbose:
+                    print(f"✓ Добавлено телефонов: {added} из {len(rows)}")
+                return added
+
+        except Error as e:
+            print(f"✗ Ошибка при загрузке телефонов: {e}")
+            return 0
+
     def get_client_info(self, client_id: int) -> Optional[Dict[str, Any]]:
         """Получает полную информацию о клиенте по ID"""
         try:
-            self.cursor.execute("""
-                SELECT 
-                    c.client_id, 
-                    c.first_name, 
-                    c.last_name, 
-                    c.email,
-                    c.created_at,
-                    ARRAY_AGG(p.phone_number) as phones
-                FROM clients c
-                LEFT JOIN phones p ON c.client_id = p.client_id
-                WHERE c.client_id = %s
-                GROUP BY c.client_id, c.first_name, c.last_name, c.email, c.created_at;
-            """, (client_id,))
-
-            result = self.cursor.fetchone()
-            if result:
-                return {
-                    'client_id': result[0],
-                    'first_name': result[1],
-                    'last_name': result[2],
-                    'email': result[3],
-                    'created_at': result[4],
-                    'phones': result[5] if result[5] else []
-                }
-            return None
+            with self._conn() as connection, connection.cursor() as cursor:
+                cursor.execute(SQL_CLIENT_INFO, (client_id,))
+
+                return cursor.fetchone()
 
         except Error as e:
             print(f"✗ Ошибка: {e}")
             return None
 
-    def get_all_clients(self) -> List[Dict[str, Any]]:
-        """Получает список всех клиентов"""
+    def get_all_clients(self) -> Iterator[Dict[str, Any]]:
+        """
+        Возвращает всех клиентов по одному
+
+        Строки читаются серверным (именованным) курсором порциями по
+        itersize, поэтому вся таблица не загружается в память целиком.
+        """
         try:
-            self.cursor.execute("""
-                SELECT 
-                    c.client_id, 
-                    c.first_name, 
-                    c.last_name, 
-                    c.email,
-                    c.created_at,
-                    ARRAY_AGG(p.phone_number) as phones
-                FROM clients c
-                LEFT JOIN phones p ON c.client_id = p.client_id
-                GROUP BY c.client_id, c.first_name, c.last_name, c.email, c.created_at
-                ORDER BY c.client_id;
-            """)
-
-            results = self.cursor.fetchall()
-            clients = []
-            for row in results:
-                client = {
-                    'client_id': row[0],
-                    'first_name': row[1],
-                    'last_name': row[2],
-                    'email': row[3],
-                    'created_at': row[4],
-                    'phones': row[5] if row[5] else []
-                }
-                clients.append(client)
-
-            return clients
+            with self._conn() as connection, connection.cursor(name='all_clients') as cursor:
+                cursor.itersize = 2000
+                cursor.execute(SQL_ALL_CLIENTS)
+                yield from cursor
 
         except Error as e:
             print(f"✗ Ошибка: {e}")
-            return []
 
     def show_all_clients(self) -> None:
         """Показывает всех клиентов в удобном формате"""
-        clients = self.get_all_clients()
+        print(f"\n{BANNER}")
+        print("ВСЕ КЛИЕНТЫ В БАЗЕ")
+        print(BANNER)
 
-        print(f"\n{'=' * 60}")
-        print(f"ВСЕ КЛИЕНТЫ В БАЗЕ (всего: {len(clients)})")
-        print(f"{'=' * 60}")
+        total = 0
+        for total, client in enumerate(self.get_all_clients(), 1):
+            self._print_client(total, client)
 
-        if not clients:
+        if not total:
             print("В базе нет клиентов")
-            return
-
-        for i, client in enumerate(clients, 1):
-            print(f"\n{i}. {client['first_name']} {client['last_name']}")
-            print(f"   ID: {client['client_id']}")
-            print(f"   Email: {client['email']}")
-            print(f"   Телефоны: {', '.join(client['phones']) if client['phones'] else 'нет телефонов'}")
-            print(f"   Зарегистрирован: {client['created_at'].strftime('%d.%m.%Y %H:%M')}")
+        else:
+            print(f"\nВсего клиентов: {total}")
 
     def close_connection(self) -> None:
-        """Закрывает подключение к базе данных"""
-        if self.connection:
-            self.cursor.close()
-            self.connection.close()
-            print("\n✓ Подключение к базе данных закрыто")
+        """Закрывает все подключения пула (prepared statements удаляются вместе с сессиями)"""
+        if self.pool and not self.pool.closed:
+            self.pool.closeall()
+            if self.verbose:
+                print("\n✓ Подключение к базе данных закрыто")
 
 
 def demonstrate_functions():
@@ -502,9 +895,9 @@ def demonstrate_functions():
     Демонстрация работы всех функций
     Эта функция запускается автоматически при запуске программы
     """
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("ПРОГРАММА ДЛЯ УПРАВЛЕНИЯ КЛИЕНТАМИ")
-    print("=" * 60)
+    print(BANNER)
 
     # ========== НАСТРОЙКИ ПОДКЛЮЧЕНИЯ ==========
     # ИЗМЕНИТЕ ЭТИ НАСТРОЙКИ ПОД СВОЙ КОМПЬЮТЕР!
@@ -530,7 +923,7 @@ def demonstrate_functions():
     # ========== ПОДКЛЮЧЕНИЕ К БАЗЕ ==========
     try:
         print("\n🔗 ПОДКЛЮЧЕНИЕ К БАЗЕ ДАННЫХ...")
-        db = ClientDatabase(**DB_CONFIG)
+        db = ClientDatabase(**DB_CONFIG, verbose=True)
     except Exception as e:
         print(f"\n❌ Не удалось подключиться: {e}")
         print("\nПроверьте:")
@@ -541,9 +934,9 @@ def demonstrate_functions():
 
     # ========== ДЕМОНСТРАЦИЯ ВСЕХ ФУНКЦИЙ ==========
 
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("НАЧАЛО ДЕМОНСТРАЦИИ")
-    print("=" * 60)
+    print(BANNER)
 
     # ФУНКЦИЯ 1: Создание таблиц
     db.create_tables()
@@ -558,19 +951,11 @@ def demonstrate_functions():
         phones=["+79161234567", "+74951234567"]
     )
 
-    client2_id = db.add_client(
-        first_name="Петр",
-        last_name="Петров",
-        email="petrov@example.com",
-        phones=["+79169876543"]
-    )
-
-    client3_id = db.add_client(
-        first_name="Мария",
-        last_name="Сидорова",
-        email="sidorova@example.com"
-        # Без телефона - клиент может не иметь телефона!
-    )
+    # Несколько клиентов с телефонами можно добавить одной транзакцией
+    client2_id, client3_id = db.add_clients([
+        ("Петр", "Петров", "petrov@example.com", ["+79169876543"]),
+        ("Мария", "Сидорова", "sidorova@example.com", None),  # Без телефона - клиент может не иметь телефона!
+    ])
 
     # ФУНКЦИЯ 3: Добавление телефонов
     print("\n📱 ДОБАВЛЯЕМ ТЕЛЕФОНЫ:")
@@ -609,17 +994,17 @@ def demonstrate_functions():
     db.delete_client(client3_id)
 
     # Показываем финальный результат
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("ФИНАЛЬНЫЙ РЕЗУЛЬТАТ")
-    print("=" * 60)
+    print(BANNER)
     db.show_all_clients()
 
     # Закрываем подключение
     db.close_connection()
 
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("✅ ДЕМОНСТРАЦИЯ ЗАВЕРШЕНА УСПЕШНО!")
-    print("=" * 60)
+    print(BANNER)
     print("\nВсе функции были продемонстрированы:")
     print("1. create_tables() - создание структуры БД ✓")
     print("2. add_client() - добавление клиента ✓")
@@ -641,7 +1026,8 @@ def simple_test():
     db = ClientDatabase(
         dbname='clients_db',
         user='postgres',
-        password='password'
+        password='password',
+        verbose=True
     )
 
     # Создаем таблицы